@@ -8,6 +8,7 @@ from rich.table import Table
 from . import __version__
 from .commands import COMMAND_CATEGORIES, COMMANDS, COMMANDS_BY_CATEGORY
 from .commands.github.cli import github_app
+from .utils.functional import install_fast_loop
 
 console = Console()
 
@@ -177,6 +178,7 @@ def menu_command() -> None:
 
 def main() -> None:
     """CLI entry point."""
+    install_fast_loop()
     app()
 
 
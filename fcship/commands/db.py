@@ -9,7 +9,9 @@ from rich.console import Console
 from rich.panel import Panel
 
 from fcship.tui.display import DisplayContext, error_message, success_message
-from fcship.utils.error_handling import handle_command_errors
+from fcship.utils.error_handling import handle_command_errors, no_error_wrap
+
+VALID_OPERATIONS = ("migration", "migrate", "rollback")
 
 
 @dataclass(frozen=True)
@@ -174,12 +176,10 @@ def rollback_migration(ctx: DisplayContext = None):
 @effect.result[tuple[str, str | None], DbError]()
 def validate_db_operation(operation: str, name: str | None = None):
     """Validate database operation."""
-    valid_operations = ["migration", "migrate", "rollback"]
-
-    if operation not in valid_operations:
+    if operation not in VALID_OPERATIONS:
         yield Error(
             DbError.ValidationError(
-                f"Invalid operation '{operation}'. Must be one of: {', '.join(valid_operations)}"
+                f"Invalid operation '{operation}'. Must be one of: {', '.join(VALID_OPERATIONS)}"
             )
         )
         return
@@ -209,6 +209,7 @@ def handle_db_error(error: DbError, ctx: DisplayContext = None):
 
 
 @handle_command_errors
+@no_error_wrap
 @effect.result[str, DbError]()
 def db(
     operation: str = typer.Argument(..., help="Operation to perform [migration/migrate/rollback]"),
@@ -11,8 +11,10 @@ from rich.console import Console
 
 from fcship.templates.domain_templates import get_domain_templates
 from fcship.tui.display import DisplayContext, error_message, success_message
-from fcship.utils.error_handling import handle_command_errors
-from fcship.utils.file_utils import ensure_directory, write_file
+from fcship.utils.error_handling import handle_command_errors, no_error_wrap
+from fcship.utils.file_utils import PathTracker, ensure_directory, write_file
+
+VALID_OPERATIONS = ("create",)
 
 
 @tagged_union
@@ -48,29 +50,13 @@ class DomainContext:
     files: Map[str, str]  # Maps relative file path to content
 
 
-@dataclass(frozen=True)
-class FileCreationTracker:
-    """Tracks created files."""
-
-    files: list[Path] = None
-
-    def __post_init__(self):
-        object.__setattr__(self, "files", self.files or [])
-
-    def add_file(self, path: Path) -> "FileCreationTracker":
-        """Add a file to the tracker."""
-        return FileCreationTracker(files=self.files + [path])
-
-
 @effect.result[str, DomainError]()
 def validate_domain_operation(operation: str):
     """Validate the domain operation."""
-    valid_operations = ["create"]
-
-    if operation not in valid_operations:
+    if operation not in VALID_OPERATIONS:
         yield Error(
             DomainError.ValidationError(
-                f"Invalid operation '{operation}'. Must be one of: {', '.join(valid_operations)}"
+                f"Invalid operation '{operation}'. Must be one of: {', '.join(VALID_OPERATIONS)}"
             )
         )
         return
@@ -144,11 +130,11 @@ def create_domain_file(domain_name: str, file_path: str, content: str):
         )
 
 
-@effect.result[FileCreationTracker, DomainError]()
+@effect.result[PathTracker, DomainError]()
 def create_domain_files(ctx: DomainContext):
     """Create all domain files."""
     try:
-        tracker = FileCreationTracker()
+        created = []
 
         # Process each file
         for file_path, content in ctx.files.items():
@@ -158,10 +144,9 @@ def create_domain_files(ctx: DomainContext):
                 yield Error(result.error)
                 return
 
-            # Update tracker
-            tracker = tracker.add_file(result.ok)
+            created.append(result.ok)
 
-        yield Ok(tracker)
+        yield Ok(PathTracker(files=created))
     except Exception as e:
         yield Error(
             DomainError.FileError(f"domain/{ctx.name}", f"Failed to create domain files: {e!s}")
@@ -218,6 +203,7 @@ def create_domain(name: str, display_ctx: DisplayContext = None):
 
 
 @handle_command_errors
+@no_error_wrap
 @effect.result[str, DomainError]()
 def domain(
     operation: str = typer.Argument(..., help="Operation to perform [create]"),
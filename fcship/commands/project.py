@@ -12,7 +12,9 @@ from rich.panel import Panel
 
 from fcship.templates.project_templates import get_project_templates
 from fcship.tui.display import DisplayContext, error_message, success_message
-from fcship.utils.error_handling import handle_command_errors
+from fcship.utils.error_handling import handle_command_errors, no_error_wrap
+
+VALID_OPERATIONS = ("init",)
 
 
 @tagged_union
@@ -75,12 +77,10 @@ class FileCreationTracker:
 @effect.result[str, ProjectError]()
 def validate_project_operation(operation: str):
     """Validate the project operation."""
-    valid_operations = ["init"]
-
-    if operation not in valid_operations:
+    if operation not in VALID_OPERATIONS:
         yield Error(
             ProjectError.ValidationError(
-                f"Invalid operation '{operation}'. Must be one of: {', '.join(valid_operations)}"
+                f"Invalid operation '{operation}'. Must be one of: {', '.join(VALID_OPERATIONS)}"
             )
         )
         return
@@ -191,7 +191,7 @@ def create_project_file(ctx: ProjectContext, file_path: str, content: str):
 def create_project_directories(ctx: ProjectContext):
     """Create all project directories."""
     try:
-        tracker = FileCreationTracker()
+        created = []
 
         # Process each folder
         for folder in ctx.folders:
@@ -201,10 +201,9 @@ def create_project_directories(ctx: ProjectContext):
                 yield Error(result.error)
                 return
 
-            # Update tracker
-            tracker = tracker.add_file(result.ok)
+            created.append(result.ok)
 
-        yield Ok(tracker)
+        yield Ok(FileCreationTracker(files=created))
     except Exception as e:
         yield Error(
             ProjectError.FileError(
@@ -217,7 +216,7 @@ def create_project_directories(ctx: ProjectContext):
 def create_project_files(ctx: ProjectContext):
     """Create all project files."""
     try:
-        tracker = FileCreationTracker()
+        created = []
 
         # Process each file
         for file_path, content in ctx.templates.items():
@@ -227,10 +226,9 @@ def create_project_files(ctx: ProjectContext):
                 yield Error(result.error)
                 return
 
-            # Update tracker
-            tracker = tracker.add_file(result.ok)
+            created.append(result.ok)
 
-        yield Ok(tracker)
+        yield Ok(FileCreationTracker(files=created))
     except Exception as e:
         yield Error(
             ProjectError.FileError(str(ctx.root_path), f"Failed to create project files: {e!s}")
@@ -317,6 +315,7 @@ def init_project(name: str, display_ctx: DisplayContext = None):
 
 
 @handle_command_errors
+@no_error_wrap
 @effect.result[str, ProjectError]()
 def project(
     operation: str = typer.Argument(..., help="Operation to perform [init]"),
@@ -11,8 +11,10 @@ from rich.console import Console
 
 from fcship.templates.repo_templates import get_repo_templates
 from fcship.tui.display import DisplayContext, error_message, success_message
-from fcship.utils.error_handling import handle_command_errors
-from fcship.utils.file_utils import ensure_directory, write_file
+from fcship.utils.error_handling import handle_command_errors, no_error_wrap
+from fcship.utils.file_utils import PathTracker, ensure_directory, write_file
+
+VALID_OPERATIONS = ("create",)
 
 
 @tagged_union
@@ -48,29 +50,13 @@ class RepoContext:
     files: Map[str, str]  # Maps relative file path to content
 
 
-@dataclass(frozen=True)
-class FileCreationTracker:
-    """Tracks created files."""
-
-    files: list[Path] = None
-
-    def __post_init__(self):
-        object.__setattr__(self, "files", self.files or [])
-
-    def add_file(self, path: Path) -> "FileCreationTracker":
-        """Add a file to the tracker."""
-        return FileCreationTracker(files=self.files + [path])
-
-
 @effect.result[str, RepoError]()
 def validate_repo_operation(operation: str):
     """Validate the repository operation."""
-    valid_operations = ["create"]
-
-    if operation not in valid_operations:
+    if operation not in VALID_OPERATIONS:
         yield Error(
             RepoError.ValidationError(
-                f"Invalid operation '{operation}'. Must be one of: {', '.join(valid_operations)}"
+                f"Invalid operation '{operation}'. Must be one of: {', '.join(VALID_OPERATIONS)}"
             )
         )
         return
@@ -142,11 +128,11 @@ def create_repo_file(file_path: str, content: str):
         yield Error(RepoError.FileError(file_path, f"Unexpected error: {e!s}"))
 
 
-@effect.result[FileCreationTracker, RepoError]()
+@effect.result[PathTracker, RepoError]()
 def create_repo_files(ctx: RepoContext):
     """Create all repository files."""
     try:
-        tracker = FileCreationTracker()
+        created = []
 
         # Process each file
         for file_path, content in ctx.files.items():
@@ -156,10 +142,9 @@ def create_repo_files(ctx: RepoContext):
                 yield Error(result.error)
                 return
 
-            # Update tracker
-            tracker = tracker.add_file(result.ok)
+            created.append(result.ok)
 
-        yield Ok(tracker)
+        yield Ok(PathTracker(files=created))
     except Exception as e:
         yield Error(RepoError.FileError("repository", f"Failed to create repository files: {e!s}"))
 
@@ -214,6 +199,7 @@ def create_repo(name: str, display_ctx: DisplayContext = None):
 
 
 @handle_command_errors
+@no_error_wrap
 @effect.result[str, RepoError]()
 def repo(
     operation: str = typer.Argument(..., help="Operation to perform [create]"),
@@ -13,6 +13,9 @@ from fcship.utils import (
     validate_operation,
 )
 
+VALID_OPERATIONS = ("create",)
+REQUIRES_NAME = ("create",)
+
 
 @handle_command_errors
 def create_service(name: str) -> None:
@@ -32,5 +35,5 @@ def service(
     name: str = typer.Argument(..., help="Name of the service"),
 ) -> None:
     """Create a new service with required files."""
-    validate_operation(operation, ["create"], name, requires_name=["create"])
+    validate_operation(operation, VALID_OPERATIONS, name, requires_name=REQUIRES_NAME)
     create_service(name)
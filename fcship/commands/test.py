@@ -10,9 +10,11 @@ from rich.console import Console
 
 from fcship.templates.test_templates import get_test_template
 from fcship.tui.display import DisplayContext, error_message, success_message
-from fcship.utils.error_handling import handle_command_errors
+from fcship.utils.error_handling import handle_command_errors, no_error_wrap
 from fcship.utils.file_utils import ensure_directory, write_file
 
+VALID_OPERATIONS = ("create",)
+
 
 @tagged_union
 class TestError:
@@ -62,12 +64,10 @@ def validate_test_type(test_type: str):
 @effect.result[str, TestError]()
 def validate_test_operation(operation: str):
     """Validate the test operation."""
-    valid_operations = ["create"]
-
-    if operation not in valid_operations:
+    if operation not in VALID_OPERATIONS:
         yield Error(
             TestError.ValidationError(
-                f"Invalid operation '{operation}'. Must be one of: {', '.join(valid_operations)}"
+                f"Invalid operation '{operation}'. Must be one of: {', '.join(VALID_OPERATIONS)}"
             )
         )
         return
@@ -182,6 +182,7 @@ def create_test(test_type: str, name: str, display_ctx: DisplayContext = None):
 
 
 @handle_command_errors
+@no_error_wrap
 @effect.result[str, TestError]()
 def test(
     operation: str = typer.Argument(..., help="Operation to perform [create]"),
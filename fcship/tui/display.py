@@ -6,17 +6,15 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Literal, Protocol, TypeVar
 
-from expression import Error, Ok, Result, effect, pipe, tagged_union
-from rich.console import Console
+from expression import Error, Ok, Result, effect, tagged_union
+from rich.console import Console, RenderableType
 from rich.rule import Rule
+from rich.styled import Styled
 
 from .types import ConsoleProtocol, DisplayError, console
 
 T = TypeVar("T")
 
-# Create console instance
-console = Console()
-
 
 # Protocol for console abstraction
 class ConsoleProtocol(Protocol):
@@ -115,24 +113,45 @@ def validate_batch_messages(
     return Ok(BatchMessages(messages=validated_messages))
 
 
+_INDENTS = tuple("  " * level for level in range(32))
+
+
+def _indent(level: int) -> str:
+    return _INDENTS[level] if 0 <= level < len(_INDENTS) else "  " * level
+
+
 # Pure console I/O functions
 def print_styled(ctx: DisplayContext, message: DisplayMessage) -> DisplayResult:
     """Pure function to print styled message to console"""
+    try:
+        # Pass the style to Rich instead of wrapping the content in markup tags, so plain
+        # content takes Rich's no-markup fast path; markup inside the content still renders
+        indent = _indent(message.indent_level)
+        if message.style:
+            ctx.console.print(f"{indent}{message.content}", style=message.style)
+        else:
+            ctx.console.print(f"{indent}{message.content}")
+        return Ok(None)
+    except Exception as e:
+        return Error(DisplayError.Rendering("Failed to print styled message", e))
 
-    def format_message() -> str:
-        indent = "  " * message.indent_level
-        return (
-            f"{indent}[{message.style}]{message.content}[/{message.style}]"
-            if message.style
-            else f"{indent}{message.content}"
-        )
 
+def _render_line(console: Console, message: DisplayMessage) -> RenderableType:
+    # Same steps console.print takes for print_styled's (text, style=...) call
+    text = console.render_str(f"{_indent(message.indent_level)}{message.content}")
+    return Styled(text, message.style) if message.style else text
+
+
+def print_styled_lines(ctx: DisplayContext, messages: list[DisplayMessage]) -> DisplayResult:
+    """Pure function to print several styled messages with a single console call"""
     try:
-        formatted = format_message()
-        ctx.console.print(formatted)
+        # Each line is parsed on its own, so markup cannot leak from one message into the
+        # next; the lines render exactly as print_styled would render them one by one
+        lines = [_render_line(ctx.console, message) for message in messages]
+        ctx.console.print(*lines, sep="\n")
         return Ok(None)
     except Exception as e:
-        return Error(DisplayError.Rendering("Failed to print styled message", e))
+        return Error(DisplayError.Rendering("Failed to print styled messages", e))
 
 
 def print_rule(ctx: DisplayContext, message: str, style: str | None = None) -> DisplayResult:
@@ -145,8 +164,8 @@ def print_rule(ctx: DisplayContext, message: str, style: str | None = None) -> D
         return Error(DisplayError.Rendering("Failed to print rule", e))
 
 
-# Create display context
-display_ctx = DisplayContext(console=Console())
+# Create display context around the shared console
+display_ctx = DisplayContext(console=console)
 
 
 @effect.result[None, DisplayError]()
@@ -158,19 +177,18 @@ def handle_display(
     return print_styled(ctx, validated)
 
 
-@effect.result[None, DisplayError]()
-def display_message(
-    ctx: DisplayContext, message: DisplayMessage
-) -> Generator[Any, None, Result[None, DisplayError]]:
-    return (yield from handle_display(ctx, message))
+def display_message(ctx: DisplayContext, message: DisplayMessage) -> DisplayResult:
+    """Validate and print a message without entering the effect builder.
+
+    Keeps the shape callers unwrap with ``yield from``: a validation failure is an
+    Error, otherwise the print result is returned wrapped in Ok.
+    """
+    validated = validate_message(message)
+    return Ok(print_styled(ctx, validated.ok)) if validated.is_ok() else validated
 
 
 def success_message(ctx: DisplayContext, content: str) -> DisplayResult:
-    return pipe(
-        content,
-        lambda c: DisplayMessage(content=c, style=DisplayStyle.SUCCESS.value),
-        lambda m: display_message(ctx, m),
-    )
+    return display_message(ctx, DisplayMessage(content=content, style=DisplayStyle.SUCCESS.value))
 
 
 @effect.result[None, DisplayError]()
@@ -190,11 +208,7 @@ def error_message(
 
 
 def warning_message(ctx: DisplayContext, content: str) -> DisplayResult:
-    return pipe(
-        content,
-        lambda c: DisplayMessage(content=c, style=DisplayStyle.WARNING.value),
-        lambda m: display_message(ctx, m),
-    )
+    return display_message(ctx, DisplayMessage(content=content, style=DisplayStyle.WARNING.value))
 
 
 def display_rule(ctx: DisplayContext, content: str, style: str | None = None) -> DisplayResult:
@@ -226,12 +240,19 @@ def process_messages(
 def batch_display_messages(
     ctx: DisplayContext, batch: BatchMessages
 ) -> Generator[Any, None, Result[None, DisplayError]]:
-    return (yield from process_messages(ctx, batch))
+    """Validate every message first, then render the whole batch in one console print"""
+    validated_batch = yield from validate_batch_messages(batch)
+    if validated_batch.is_error():
+        return validated_batch
+
+    messages = [create_display_message(msg_pair) for msg_pair in validated_batch.ok.messages]
+    for message in messages:
+        yield from validate_message(message)
+
+    # Returned as is, so the builder wraps it in Ok like every other display result
+    result = print_styled_lines(ctx, messages)
+    return result
 
 
 def display_indented_text(ctx: DisplayContext, content: str, level: int = 1) -> DisplayResult:
-    return pipe(
-        content,
-        lambda c: DisplayMessage(content=c, indent_level=level),
-        lambda m: display_message(ctx, m),
-    )
+    return display_message(ctx, DisplayMessage(content=content, indent_level=level))
@@ -49,18 +49,24 @@ class DisplayError:
 
     def __str__(self) -> str:
         """Convert error to string."""
-        match self:
-            case DisplayError(tag="validation", validation=msg):
-                return f"Validation Error: {msg}"
-            case DisplayError(tag="rendering", rendering=(msg, exc)):
-                return f"Display Error: {msg} - {exc!s}"
-            case DisplayError(tag="interaction", interaction=(msg, exc)):
-                return f"Input Error: {msg} - {exc!s}"
-            case DisplayError(tag="timeout", timeout=(msg, exc)):
-                return f"Timeout Error: {msg} - {exc!s}"
-            case DisplayError(tag="execution", execution=(msg, err)):
-                return f"Execution Error: {msg} - {err}"
-            case DisplayError(tag="input", input=(msg, err)):
-                return f"Input Error: {msg} - {err}"
-            case _:
-                return "Unknown Error"
+        label = _ERROR_LABELS.get(self.tag)
+        if label is None:
+            return "Unknown Error"
+        value = getattr(self, self.tag)
+        if self.tag == "validation":
+            return f"{label}: {value}"
+        if isinstance(value, tuple) and len(value) == 2:
+            msg, detail = value
+            return f"{label}: {msg} - {detail!s}"
+        return "Unknown Error"
+
+
+# One dict lookup per error instead of walking a match statement case by case
+_ERROR_LABELS = {
+    "validation": "Validation Error",
+    "rendering": "Display Error",
+    "interaction": "Input Error",
+    "timeout": "Timeout Error",
+    "execution": "Execution Error",
+    "input": "Input Error",
+}
@@ -118,24 +118,18 @@ async def with_retry(
 ) -> Result[T, DisplayError]:
     """Execute a UI operation with retry on failure"""
 
-    async def try_operation(attempt: int) -> Result[T, DisplayError]:
-        result = operation()
-        if result.is_ok() or attempt >= config.max_attempts - 1:
-            return result
+    result = operation()
+    attempt = 0
+    while result.is_error() and attempt < config.max_attempts - 1:
         await asyncio.sleep(config.delay)
-        return await try_operation(attempt + 1)
-
-    return await try_operation(0)
+        attempt += 1
+        result = operation()
+    return result
 
 
 def aggregate_errors(errors: list[DisplayError]) -> DisplayError:
     """Combine multiple errors into a single validation error"""
-    return pipe(
-        errors,
-        lambda errs: map(str, errs),
-        lambda msgs: "\n".join(msgs),
-        lambda msg: DisplayError.Validation(msg),
-    )
+    return DisplayError.Validation("\n".join(map(str, errors)))
 
 
 def recover_ui(
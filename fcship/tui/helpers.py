@@ -1,8 +1,8 @@
-from collections.abc import Callable, Iterable
-from functools import reduce
+from collections.abc import Callable, Iterable, Sized
+from functools import lru_cache
 from typing import Any, Literal, TypeVar
 
-from expression import Error, Ok, Result, pipe, tagged_union
+from expression import Error, Ok, Result, tagged_union
 
 from fcship.tui.errors import DisplayError
 
@@ -63,17 +63,21 @@ def _check_non_empty(value: str, name: str) -> Result[str, DisplayError]:
 
 
 def validate_input(value: str | None, name: str) -> Result[str, DisplayError]:
-    return pipe(
-        _check_type(value, str, name), lambda r: r.bind(lambda v: _check_non_empty(v, name))
-    )
+    # Called on nearly every validation path; branch directly instead of binding lambdas
+    checked = _check_type(value, str, name)
+    return _check_non_empty(value, name) if checked.is_ok() else checked
 
 
 VALID_STYLES = frozenset(
     {"red", "green", "blue", "yellow", "cyan", "magenta", "white", "black", "bold red"}
 )
+# Joined once at import; sorted so the message does not depend on set iteration order
+_VALID_STYLES_FORMAT = f"one of: {', '.join(sorted(VALID_STYLES))}"
 
 
+@lru_cache(maxsize=64)
 def _contains_valid_style(style: str) -> bool:
+    # Substring scan so compound styles like "bold green" pass; cached per style string
     return any(s in style for s in VALID_STYLES)
 
 
@@ -85,50 +89,43 @@ def _validate_style_content(style: str) -> Result[str, DisplayError]:
     return (
         Ok(style)
         if _contains_valid_style(style)
-        else Error(
-            to_display_error(ValidationError.Format("style", f"one of: {', '.join(VALID_STYLES)}"))
-        )
+        else Error(to_display_error(ValidationError.Format("style", _VALID_STYLES_FORMAT)))
     )
 
 
-def validate_style(style: str) -> Result[str, DisplayError]:
-    return pipe(validate_input(style, "Style"), lambda r: r.bind(_validate_style_content))
-
-
-def _combine_validation_results(
-    results: list[Result[T, DisplayError]],
-) -> Result[list[T], DisplayError]:
-    """Combines multiple validation results into a single Result"""
+@lru_cache(maxsize=32)
+def _validate_style_cached(style: str) -> Result[str, DisplayError]:
+    checked = validate_input(style, "Style")
+    return _validate_style_content(style) if checked.is_ok() else checked
 
-    def combine(
-        acc: Result[list[T], DisplayError], curr: Result[T, DisplayError]
-    ) -> Result[list[T], DisplayError]:
-        if acc.is_error():
-            return acc
-        if curr.is_error():
-            return curr
-        return Ok([*acc.ok, curr.ok])
 
-    return pipe(results, lambda r: reduce(combine, r, Ok([])))
+def validate_style(style: str) -> Result[str, DisplayError]:
+    # Results are immutable, so a cached one can be shared; only strings are
+    # cached because other values may be unhashable
+    if isinstance(style, str):
+        return _validate_style_cached(style)
+    return validate_input(style, "Style")
 
 
 def validate_panel_inputs(
     title: str, content: str, style: str
 ) -> Result[tuple[str, str, str], DisplayError]:
-    validations = [
+    for checked in (
         validate_input(title, "Title"),
         validate_input(content, "Content"),
         validate_style(style),
-    ]
-    return pipe(_combine_validation_results(validations), lambda r: r.map(tuple))
+    ):
+        if checked.is_error():
+            return Error(checked.error)
+    return Ok((title, content, style))
 
 
 def _validate_row_type(row: Any) -> Result[tuple[str, str], DisplayError]:
-    return (
-        Ok(row)
-        if isinstance(row, tuple) and len(row) == 2 and all(isinstance(x, str) for x in row)
-        else Error(to_display_error(ValidationError.Format("row", "tuple of two strings")))
-    )
+    match row:
+        case tuple((str(), str())):
+            return Ok(row)
+        case _:
+            return Error(to_display_error(ValidationError.Format("row", "tuple of two strings")))
 
 
 def validate_table_row(row: Any) -> Result[tuple[str, str], DisplayError]:
@@ -162,19 +159,22 @@ def _validate_row_types(row: list[Any]) -> Result[list[str], DisplayError]:
 def validate_table_data(
     headers: list[str], rows: list[tuple[str, str]]
 ) -> Result[None, DisplayError]:
-    def validate_row(row: list[Any], header_len: int) -> Result[list[str], DisplayError]:
-        return pipe(_validate_row_length(row, header_len), lambda r: r.bind(_validate_row_types))
-
-    return pipe(
-        _validate_headers(headers),
-        lambda r: r.bind(
-            lambda h: _combine_validation_results([validate_row(row, len(h)) for row in rows])
-        ),
-        lambda r: r.map(lambda _: None),
-    )
-
-
-def _validate_items_not_empty(items: list[Any]) -> Result[list[Any], DisplayError]:
+    headers_result = _validate_headers(headers)
+    if headers_result.is_error():
+        return Error(headers_result.error)
+
+    # One pass over the rows, stopping at the first invalid one
+    header_len = len(headers)
+    for row in rows:
+        row_result = _validate_row_length(row, header_len)
+        if row_result.is_ok():
+            row_result = _validate_row_types(row)
+        if row_result.is_error():
+            return Error(row_result.error)
+    return Ok(None)
+
+
+def _validate_items_not_empty(items: Sized) -> Result[Sized, DisplayError]:
     return Ok(items) if items else Error(to_display_error(ValidationError.Empty("items list")))
 
 
@@ -189,14 +189,12 @@ def _validate_callable(fn: Any) -> Result[Callable, DisplayError]:
 def validate_progress_inputs(
     items: Iterable, process_fn: Callable, description: str
 ) -> Result[None, DisplayError]:
-    return pipe(
-        Ok(list(items)),
-        lambda items_list: _combine_validation_results(
-            [
-                _validate_items_not_empty(items_list),
-                _validate_callable(process_fn),
-                validate_input(description, "Description"),
-            ]
-        ),
-        lambda r: r.map(lambda _: None),
-    ).map_error(lambda e: DisplayError.Validation(str(e)))
+    for checked in (
+        # Sized inputs are checked in place; only lazy iterables need materializing
+        _validate_items_not_empty(items if isinstance(items, Sized) else list(items)),
+        _validate_callable(process_fn),
+        validate_input(description, "Description"),
+    ):
+        if checked.is_error():
+            return Error(DisplayError.Validation(str(checked.error)))
+    return Ok(None)
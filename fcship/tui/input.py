@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any, Protocol, TypeVar
 
 import typer
-from expression import Error, Ok, Result, effect, pipe
+from expression import Error, Ok, Result, effect
 
 from fcship.tui.errors import DisplayError
 
@@ -80,15 +80,14 @@ def get_confirmation(
 
 
 @effect.result[bool, DisplayError]()
-def confirm_action(message: str, ctx: InputContext = input_ctx) -> Result[bool, DisplayError]:
+def confirm_action(
+    message: str, ctx: InputContext = input_ctx
+) -> Generator[Result[bool, DisplayError], Any, Result[bool, DisplayError]]:
     """Get user confirmation for an action"""
-    return pipe(
-        get_confirmation(message, ctx),
-        lambda result: result.bind(
-            lambda confirmed: (
-                Ok(True)
-                if confirmed
-                else Error(DisplayError.Validation("Action cancelled by user"))
-            )
-        ),
-    )
+    result = yield from get_confirmation(message, ctx)
+    if result.is_error():
+        yield result
+    elif result.ok:
+        yield Ok(True)
+    else:
+        yield Error(DisplayError.Validation("Action cancelled by user"))
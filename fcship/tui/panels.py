@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 from typing import TypeVar
 
-from expression import Error, Ok, Result, effect, pipe
+from expression import Error, Ok, Result, effect
+from rich.console import Group, RenderableType
 from rich.panel import Panel
+from rich.protocol import is_renderable
 
 from fcship.tui.errors import DisplayError
-from fcship.tui.helpers import validate_panel_inputs
+from fcship.tui.helpers import validate_input, validate_panel_inputs, validate_style
 
 T = TypeVar("T")
 
@@ -15,7 +17,7 @@ class PanelConfig:
     """Configuration for a panel"""
 
     title: str
-    content: str
+    content: RenderableType
     style: str
 
 
@@ -29,10 +31,8 @@ class PanelSection:
 
 def create_panel_config(title: str, content: str, style: str) -> Result[PanelConfig, DisplayError]:
     """Create a panel configuration with validation"""
-    return pipe(
-        validate_panel_inputs(title, content, style),
-        lambda r: r.map(lambda values: PanelConfig(*values)),
-    )
+    validated = validate_panel_inputs(title, content, style)
+    return Ok(PanelConfig(*validated.ok)) if validated.is_ok() else Error(validated.error)
 
 
 def _create_panel_unsafe(config: PanelConfig) -> Result[Panel, DisplayError]:
@@ -48,20 +48,12 @@ def _create_panel_unsafe(config: PanelConfig) -> Result[Panel, DisplayError]:
 def _create_panel_safe(config: PanelConfig) -> Result[Panel, DisplayError]:
     """Safe version of panel creation with error handling"""
 
-    def validate_config(cfg: PanelConfig) -> Result[PanelConfig, DisplayError]:
-        return (
-            Ok(cfg)
-            if isinstance(cfg, PanelConfig)
-            and all(isinstance(v, str) for v in (cfg.title, cfg.content, cfg.style))
-            else Error(
-                DisplayError.Rendering(
-                    "Invalid panel configuration: all fields must be strings", None
-                )
-            )
-        )
-
-    return pipe(
-        Ok(config), lambda r: validate_config(config), lambda r: r.bind(_create_panel_unsafe)
+    if isinstance(config, PanelConfig) and all(
+        isinstance(v, str) for v in (config.title, config.content, config.style)
+    ):
+        return _create_panel_unsafe(config)
+    return Error(
+        DisplayError.Rendering("Invalid panel configuration: all fields must be strings", None)
     )
 
 
@@ -71,19 +63,23 @@ def _create_inner_panel(inner_style: str, section: PanelSection) -> Result[Panel
     return (yield from create_panel(section.title, section.content, inner_style))
 
 
-def _join_panels(panels: list[Panel]) -> str:
-    """Join multiple panels into a single string"""
-    return "\n".join(str(panel.renderable) for panel in panels)
-
-
 @effect.result[Panel, DisplayError]()
-def create_panel(title: str, content: str, style: str) -> Result[Panel, DisplayError]:
+def create_panel(
+    title: str, content: str | RenderableType, style: str
+) -> Result[Panel, DisplayError]:
     """
     Create a panel with title, content and style.
     Validates inputs and handles errors safely.
+    Content may also be a Rich renderable, which is passed to the panel unchanged.
     """
-    config = yield from create_panel_config(title, content, style)
-    panel = yield from _create_panel_safe(config)
+    if isinstance(content, str) or not is_renderable(content):
+        config = yield from create_panel_config(title, content, style)
+        panel = yield from _create_panel_safe(config)
+        return Ok(panel)
+
+    yield from validate_input(title, "Title")
+    yield from validate_style(style)
+    panel = yield from _create_panel_unsafe(PanelConfig(title, content, style))
     return Ok(panel)
 
 
@@ -125,6 +121,5 @@ def create_nested_panel(
     if inner_panels_result.is_error():
         return Error(inner_panels_result.error)
 
-    # Join panels and create outer panel
-    content = _join_panels(inner_panels_result.ok)
-    return (yield from create_panel(title, content, outer_style))
+    # Group the inner panels so the outer panel renders them in the same pass
+    return (yield from create_panel(title, Group(*inner_panels_result.ok), outer_style))
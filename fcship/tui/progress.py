@@ -1,17 +1,10 @@
-import multiprocessing
 import os
+import time
 from collections.abc import Callable, Generator
-from dataclasses import dataclass
-from multiprocessing.pool import Pool
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from typing import Any, Generic, Literal, TypeVar
 
-# Set multiprocessing start method to 'spawn' to avoid fork-related warnings
-# Only set it if we're on Unix-like systems (not needed on Windows)
-if os.name != "nt" and hasattr(multiprocessing, "set_start_method"):
-    import contextlib
-    with contextlib.suppress(RuntimeError):
-        multiprocessing.set_start_method("spawn", force=False)
-
 from expression import Error, Ok, Result, case, curry, effect, pipe, tag, tagged_union
 from rich.progress import (
     BarColumn,
@@ -27,6 +20,9 @@ from fcship.tui.helpers import validate_progress_inputs
 T = TypeVar("T")
 E = TypeVar("E")
 
+# Minimum seconds between redraws; Live.stop() draws the final state on exit
+PROGRESS_REFRESH_INTERVAL = 0.05
+
 
 @effect.result[None, "ProgressError"]()
 def validate_inputs(
@@ -80,6 +76,21 @@ class ProgressConfig:
     max_workers: int | None = None
 
 
+@dataclass
+class RefreshThrottle:
+    """Lets a progress redraw through at most once per interval"""
+
+    interval: float = PROGRESS_REFRESH_INTERVAL
+    last: float = float("-inf")
+
+    def due(self) -> bool:
+        now = time.monotonic()
+        if now - self.last < self.interval:
+            return False
+        self.last = now
+        return True
+
+
 @dataclass(frozen=True)
 class ProgressContext(Generic[T]):
     """Context for progress operations"""
@@ -91,6 +102,7 @@ class ProgressContext(Generic[T]):
     description: str
     parallel: bool
     max_workers: int | None
+    throttle: RefreshThrottle = field(default_factory=RefreshThrottle)
 
 
 @curry
@@ -129,8 +141,11 @@ def validate_config(config: ProgressConfig) -> Result[ProgressConfig, ProgressEr
 
 
 def create_progress(config: ProgressConfig) -> Result[Progress, ProgressError]:
-    """Create a progress bar with the given configuration"""
-    return pipe(validate_config(config), lambda r: r.map(lambda c: Progress(*c.columns)))
+    """Create a progress bar that only redraws when an item completes"""
+    return pipe(
+        validate_config(config),
+        lambda r: r.map(lambda c: Progress(*c.columns, auto_refresh=False)),
+    )
 
 
 def create_context(
@@ -162,7 +177,7 @@ def create_context(
 def process_single_item(ctx: ProgressContext[T], item: T) -> Generator[Any, Any, Result[None, E]]:
     """Process a single item and update progress"""
     result = yield from ctx.process(item)
-    ctx.progress.advance(ctx.task_id)
+    ctx.progress.update(ctx.task_id, advance=1, refresh=ctx.throttle.due())
     return result
 
 
@@ -201,27 +216,16 @@ def process_all_items(ctx: ProgressContext[T]) -> Generator[Any, Any, Result[Non
             result = yield from process_single_item(ctx, item)
             results.append(result)
     else:
-        # Parallel processing
-        # Since we can't pickle local functions, we'll process items sequentially
-        # but in a separate process to avoid blocking the main thread
-        num_workers = ctx.max_workers or multiprocessing.cpu_count()
-        chunk_size = max(1, len(ctx.items) // num_workers)
-        chunks = [ctx.items[i : i + chunk_size] for i in range(0, len(ctx.items), chunk_size)]
-
-        with Pool(processes=num_workers) as pool:
-            for chunk in chunks:
-                chunk_results = []
-                for item in chunk:
-                    try:
-                        gen = ctx.process(item)
-                        result = run_generator_to_completion(gen)
-                        chunk_results.append(result)
-                    except Exception as e:
-                        chunk_results.append(Error(str(e)))
-                results.extend(chunk_results)
-                # Update progress after each chunk
-                for _ in range(len(chunk_results)):
-                    ctx.progress.advance(ctx.task_id)
+        # Process functions are usually closures, which cannot be pickled for worker
+        # processes, so parallel items run on threads and report as each one finishes
+        num_workers = ctx.max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(process_parallel_item, item, ctx.process) for item in ctx.items
+            ]
+            for _ in as_completed(futures):
+                ctx.progress.update(ctx.task_id, advance=1, refresh=ctx.throttle.due())
+        results = [future.result() for future in futures]
 
     # Check for errors in results
     errors = [r.error for r in results if r.is_error()]
@@ -267,6 +271,10 @@ def display_progress(
     max_workers: int | None = None,
 ) -> Generator[Any, Any, Result[None, ProgressError]]:
     """Display progress while processing items"""
+    # Materialize once so generators survive both the validation pass and len();
+    # lists and tuples are already sized and are iterated in place
+    items = items if isinstance(items, (list, tuple)) else list(items)
+
     # First validate inputs
     validation_result = validate_display_inputs(items, process, description)
     if validation_result.is_error():
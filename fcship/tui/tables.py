@@ -78,10 +78,14 @@ def create_summary_table(title: str, rows: list[TableRow]) -> Result[Table, Disp
         table.add_column("Name", style="cyan")
         table.add_column("Status", style="bold")
 
-        for row in rows:
-            result = yield add_row_to_table(table, row)
-            if result.is_error():
-                yield result
+        # The table was just built here, so rows go straight in without the per-row
+        # add_row_to_table effect and its instance check
+        try:
+            for row in rows:
+                table.add_row(row.name, row.status)
+        except Exception as e:
+            yield Error(DisplayError.Rendering("Failed to add row to table", e))
+            return
 
         yield Ok(table)
     except Exception as e:
@@ -112,7 +116,8 @@ def create_multi_column_table(
         yield Error(DisplayError.Validation("Headers must be strings"))
         return
 
-    if not all(len(row) == len(headers) for row in rows):
+    header_len = len(headers)
+    if not all(len(row) == header_len for row in rows):
         yield Error(DisplayError.Validation("Row length must match number of columns"))
         return
 
@@ -4,12 +4,10 @@ Este pacote contém várias funções e classes utilitárias usadas pelo
 projeto Fast Craftsmanship.
 """
 
-from rich.console import Console
-
-from fcship.tui import error_message, success_message
+from fcship.tui import console, error_message, success_message
 from fcship.utils.docstring_example import ExampleClass, utility_function
 
-from .error_handling import handle_command_errors
+from .error_handling import handle_command_errors, no_error_wrap
 from .file_utils import (
     FileCreationTracker,
     FileError,
@@ -21,6 +19,7 @@ from .file_utils import (
 from .functional import (
     catch_errors,
     collect_results,
+    install_fast_loop,
     lift_option,
     sequence_results,
     tap,
@@ -29,9 +28,6 @@ from .functional import (
 from .type_utils import ensure_type, map_type
 from .validation import validate_operation
 
-# Create console instance for global use
-console = Console()
-
 __all__ = [
     "FileCreationTracker",
     "FileError",
@@ -45,8 +41,10 @@ __all__ = [
     "error_message",
     "file_creation_status",
     "handle_command_errors",
+    "install_fast_loop",
     "lift_option",
     "map_type",
+    "no_error_wrap",
     "sequence_results",
     "success_message",
     "tap",
@@ -1,15 +1,18 @@
 """Error handling utilities following Railway-Oriented Programming pattern."""
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any, TypeVar, overload
 
 import typer
-from expression import Error, Ok, Result, pipe
+from expression import Error, Ok, Result
 
 from fcship.tui import DisplayContext, error_message
 from fcship.tui.display import console
 
+from .validation import validate_operation as check_operation
+
 T = TypeVar("T")
 SyncFn = Callable[..., T]
 AsyncFn = Callable[..., Awaitable[T]]
@@ -30,6 +33,20 @@ class CommandError(Exception):
     pass
 
 
+_coro_cache: weakref.WeakKeyDictionary[Callable[..., Any], bool] = weakref.WeakKeyDictionary()
+
+
+def _is_coro(fn: Fn) -> bool:
+    """Memoized asyncio.iscoroutinefunction, keyed weakly on the function."""
+    try:
+        return _coro_cache[fn]
+    except KeyError:
+        is_coro = _coro_cache[fn] = asyncio.iscoroutinefunction(fn)
+        return is_coro
+    except TypeError:
+        return asyncio.iscoroutinefunction(fn)
+
+
 def _on_error(e: Exception) -> None:
     try:
         disp = error_message.__wrapped__
@@ -40,11 +57,20 @@ def _on_error(e: Exception) -> None:
     raise typer.Exit(1)
 
 
+def no_error_wrap(fn: Fn) -> Fn:
+    """Mark a command that reports its own failures so handle_command_errors skips it."""
+    fn._fc_no_wrap = True  # type: ignore[attr-defined]
+    return fn
+
+
 def handle_command_errors(fn: Fn) -> Fn:
+    if getattr(fn, "_fc_no_wrap", False):
+        return fn
+
     def handle_result(r: Result[T, Exception]) -> T:
         return r.ok if r.is_ok() else _on_error(r.error)
 
-    if asyncio.iscoroutinefunction(fn):
+    if _is_coro(fn):
 
         async def wrapper(*args: Any, **kwargs: Any) -> T:
             try:
@@ -67,31 +93,11 @@ def handle_command_errors(fn: Fn) -> Fn:
 
 def validate_operation(
     operation: str,
-    valid_operations: list[str],
+    valid_operations: Sequence[str],
     name: str | None = None,
-    requires_name: list[str] | None = None,
+    requires_name: Sequence[str] | None = None,
 ) -> str:
-    res = pipe(
-        Ok(operation),
-        lambda res: res.bind(
-            lambda op: (
-                Ok(op)
-                if op in valid_operations
-                else Error(
-                    typer.BadParameter(
-                        f"Invalid operation: {op}. Valid operations: {', '.join(valid_operations)}"
-                    )
-                )
-            )
-        ),
-        lambda res: res.bind(
-            lambda op: (
-                Ok(op)
-                if not requires_name or op not in requires_name or name
-                else Error(typer.BadParameter(f"Operation '{op}' requires a name parameter"))
-            )
-        ),
-    )
+    res = check_operation(operation, valid_operations, name, requires_name)
     if res.is_ok():
         return res.ok
     raise res.error
@@ -1,16 +1,21 @@
 """File utilities."""
 
-from collections.abc import Callable
+import asyncio
+import functools
+import os
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import NamedTuple
 
 import typer
-from expression import Error, Ok, Option, Result, effect, pipe, result
+from expression import Error, Ok, Option, Result, effect
 from expression.collections import Block, Map
 
 from fcship.tui import console
 
+from .validation import validate_operation as check_operation
+
 A = str
 E = str
 T = str
@@ -18,6 +23,8 @@ ValidationResult = Result
 FileContent = tuple[Path, str]
 RawFileContent = tuple[str, str]
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
 @dataclass(frozen=True)
 class FileError:
@@ -43,12 +50,36 @@ class FileCreationTracker:
         return Ok(FileCreationTracker(self.files.add(path, status)))
 
 
+@dataclass(frozen=True)
+class PathTracker:
+    """Tracks created paths in creation order."""
+
+    files: list[Path] = field(default_factory=list)
+
+
 @dataclass(frozen=True)
 class FileOperation:
     path: Path
     content: str
 
 
+@functools.lru_cache(maxsize=256)
+def _encode(content: str) -> bytes:
+    """Encode file content once; scaffolds reuse the same template strings often."""
+    return content.encode("utf-8")
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes through a raw file descriptor, skipping the buffered IO object stack."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def ensure_directory(path: Path) -> Result[None, FileError]:
     """Ensure directory exists."""
     try:
@@ -58,25 +89,77 @@ def ensure_directory(path: Path) -> Result[None, FileError]:
         return Error(FileError(f"Failed to create directory: {path.parent}", str(e)))
 
 
+def _write_error(path: Path, e: Exception) -> Result[None, FileError]:
+    file_path = os.fspath(path)
+    console.print(f"[red]Error writing file {file_path}: {e!s}[/red]")
+    return Error(FileError(f"Failed to write file: {file_path}", str(e)))
+
+
+def _write_contents(path: Path, data: bytes) -> Result[None, FileError]:
+    """Write encoded content to a file whose parent directory already exists."""
+    try:
+        _write_bytes(path, data)
+        return Ok(None)
+    except Exception as e:
+        return _write_error(path, e)
+
+
 def write_file(path: Path, content: str) -> Result[None, FileError]:
     """Write content to file."""
+    parent = os.fspath(path.parent)
+
     # Ensure parent directory exists
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        console.print(f"[blue]Debug: Created parent directory: {path.parent}[/blue]")
+        os.makedirs(parent, exist_ok=True)
     except Exception as e:
-        console.print(f"[red]Error creating directory {path.parent}: {e!s}[/red]")
-        return Error(FileError(f"Failed to create directory: {path.parent}", str(e)))
+        console.print(f"[red]Error creating directory {parent}: {e!s}[/red]")
+        return Error(FileError(f"Failed to create directory: {parent}", str(e)))
 
-    # Write file content
+    # Content that cannot be encoded is reported like any other failed write
     try:
-        console.print(f"[blue]Debug: Writing content to file: {path}[/blue]")
-        path.write_text(content)
-        console.print(f"[blue]Debug: Successfully wrote content to file: {path}[/blue]")
-        return Ok(None)
+        data = _encode(content)
     except Exception as e:
-        console.print(f"[red]Error writing file {path}: {e!s}[/red]")
-        return Error(FileError(f"Failed to write file: {path}", str(e)))
+        return _write_error(path, e)
+    return _write_contents(path, data)
+
+
+def _precreate_dirs(paths: Iterable[Path]) -> Result[None, FileError]:
+    """Create each distinct parent directory once, shallowest first.
+
+    Shallower directories are created before deeper ones, so most mkdir calls find
+    their parent in place and succeed with a single syscall instead of a parents walk.
+    """
+    for directory in sorted({path.parent for path in paths}, key=lambda d: len(d.parts)):
+        try:
+            try:
+                directory.mkdir(exist_ok=True)
+            except FileNotFoundError:
+                directory.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            return Error(FileError(f"Failed to create directory: {directory}", str(e)))
+    return Ok(None)
+
+
+def _create_file(
+    tracker: "FileCreationTracker | Path", rel_path: Path, content: str
+) -> Result["FileCreationTracker | FileOperation", FileError]:
+    """Create the parent directory and write a file in one step, then record it."""
+    if isinstance(tracker, Path):
+        file_path = rel_path if rel_path.is_absolute() else tracker / rel_path
+    elif isinstance(tracker, FileCreationTracker):
+        file_path = rel_path
+    else:
+        return Error(FileError("Invalid tracker type", ""))
+
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_bytes(file_path, _encode(content))
+    except Exception as e:
+        return Error(FileError(f"Failed to write file: {file_path}", str(e)))
+
+    if isinstance(tracker, Path):
+        return Ok(FileOperation(file_path, content))
+    return tracker.add_file(str(file_path))
 
 
 @effect.result[FileCreationTracker, str]()
@@ -87,96 +170,74 @@ def create_single_file(tracker, path_content: FileContent):
         rel_path = Path(rel_path)
 
     console.print(f"[blue]Debug: Creating file {rel_path}[/blue]")
+    yield _create_file(tracker, rel_path, content)
 
-    if isinstance(tracker, Path):
-        file_path = rel_path if rel_path.is_absolute() else tracker / rel_path
-        write_result = write_file(file_path, content)
-        if write_result.is_error():
-            yield Error(write_result.error)
-            return
-        yield Ok(FileOperation(file_path, content))
-    elif isinstance(tracker, FileCreationTracker):
-        # Create the file
-        write_result = write_file(rel_path, content)
-        if write_result.is_error():
-            yield Error(write_result.error)
-            return
-
-        console.print(f"[blue]Debug: Adding file to tracker: {rel_path!s}[/blue]")
-        add_result = tracker.add_file(str(rel_path))
-        if add_result.is_error():
-            yield Error(str(add_result.error))
-            return
-        yield Ok(add_result.ok)
-    else:
-        yield Error(FileError("Invalid tracker type", ""))
 
+def _write_all(pairs: list[tuple[Path, bytes]]) -> Result[None, FileError]:
+    """Write every file in order, stopping at the first failure.
 
-def build_file_path(base: Path, file_info: RawFileContent) -> FileContent:
-    return (base / file_info[0], file_info[1])
+    Writes stay on the calling thread: for scaffold-sized batches, thread pool startup
+    costs more than overlapping the writes saves.
+    """
+    for path, data in pairs:
+        written = _write_contents(path, data)
+        if written.is_error():
+            return Error(written.error)
+    return Ok(None)
 
 
 def process_all_files(base: Path, files: Map[str, str], tracker: FileCreationTracker) -> FileResult:
-    return files.fold(
-        lambda acc, item: pipe(
-            acc, result.bind(lambda tr: create_single_file(tr, build_file_path(base, item)))
-        ),
-        Ok(tracker),
-    )
+    pairs = [(base / rel_path, content) for rel_path, content in files.items()]
+    dirs = _precreate_dirs(path for path, _ in pairs)
+    if dirs.is_error():
+        return Error(dirs.error)
+
+    # Encode each distinct content once for the whole batch
+    encoded: dict[str, bytes] = {}
+    for path, content in pairs:
+        try:
+            if content not in encoded:
+                encoded[content] = content.encode("utf-8")
+        except Exception as e:
+            return _write_error(path, e)
+    written = _write_all([(path, encoded[content]) for path, content in pairs])
+    if written.is_error():
+        return Error(written.error)
+
+    # Build the immutable tracker once instead of once per file
+    created = ((os.fspath(path), "Created") for path, _ in pairs)
+    # of_list builds iteratively; of_seq recurses and overflows around 1000 entries
+    return Ok(FileCreationTracker(Map.of_list([*tracker.files.items(), *created])))
 
 
 @effect.result[FileCreationTracker, FileError]()
 def create_files(files: Map[str, str], base_path: str = ""):
-    yield pipe(
-        Ok(Path(base_path)),
-        result.bind(lambda base: process_all_files(base, files, FileCreationTracker())),
-    )
+    yield process_all_files(Path(base_path), files, FileCreationTracker())
 
 
-def format_error_message(msg: str, value: str = "") -> str:
-    return f"{msg}{f': {value}' if value else ''}"
-
-
-def create_validation_error(msg: str) -> Result[None, typer.BadParameter]:
-    return Error(typer.BadParameter(msg))
-
-
-def check(condition: bool, msg: str) -> ValidationResult:
-    return Ok(None) if condition else Error(typer.BadParameter(msg))
-
+async def acreate_files(
+    files: Map[str, str], base_path: str = ""
+) -> Result[FileCreationTracker, FileError]:
+    """Create files from an async command without blocking the event loop."""
+    # The whole batch runs serially on one worker thread. Gathering a to_thread call per
+    # file spreads the writes over the default thread pool, which is slower than writing
+    # inline for scaffold-sized batches (see _write_all)
+    return await asyncio.to_thread(process_all_files, Path(base_path), files, FileCreationTracker())
 
-def validate_name_requirement(
-    operation: str, requires_name: Block[str], name: str | None
-) -> ValidationResult:
-    return check(
-        not (operation in requires_name and not name), f"Operation '{operation}' requires name"
-    )
 
-
-def validate_operation_existence(valid_ops: Block[str], operation: str) -> ValidationResult:
-    return check(operation in valid_ops, f"Invalid operation: {operation}")
-
-
-def bind_name_validation(
-    requires_name: Block[str], name: str | None, operation: str
-) -> Callable[[Result[None, typer.BadParameter]], Result[None, typer.BadParameter]]:
-    return lambda _: validate_name_requirement(operation, requires_name, name)
+def format_error_message(msg: str, value: str = "") -> str:
+    return f"{msg}{f': {value}' if value else ''}"
 
 
 def validate_operation(
     valid_ops: Block[str], requires_name: Block[str], operation: str, name: str | None
 ) -> Result[None, typer.BadParameter]:
-    return validate_operation_existence(valid_ops, operation).bind(
-        lambda _: validate_name_requirement(operation, requires_name, name)
-    )
+    """Validate an operation; keeps this module's argument order over validation's check."""
+    return check_operation(operation, valid_ops, name, requires_name).map(lambda _: None)
 
 
 def find_file_in_tracker(tracker: FileCreationTracker, path: str) -> Option[str]:
-    return pipe(
-        tracker.files,
-        lambda files: files.filter(lambda fs: fs.path == path),
-        lambda filtered: filtered.map(lambda fs: fs.status),
-    )
+    return tracker.files.try_find(path)
 
 
 def init_file_creation_tracker() -> Result[FileCreationTracker, FileError]:
@@ -188,8 +249,10 @@ def file_creation_status(tracker: FileCreationTracker) -> str:
 
 
 __all__ = [
+    "acreate_files",
     "FileError",
     "FileOperation",
+    "PathTracker",
     "create_files",
     "create_single_file",
     "ensure_directory",
@@ -2,6 +2,9 @@
 
 import asyncio
 import functools
+import importlib
+import importlib.util
+import os
 from collections.abc import Awaitable, Callable, Sequence
 from typing import Any, ParamSpec, TypeVar
 
@@ -20,29 +23,71 @@ def lift_option(fn: Callable[P, Option[A]]) -> Callable[P, Result[A, Exception]]
     Se a função original retornar um Option com valor (Some), converte para Ok(valor).
     Caso contrário, retorna um Error com a mensagem "No value present".
     """
-    return lambda *args, **kwargs: option_to_result(fn(*args, **kwargs), "No value present")
+
+    def lifted(*args: P.args, **kwargs: P.kwargs) -> Result[A, Exception]:
+        opt = fn(*args, **kwargs)
+        return Ok(opt.value) if opt.tag == "some" else Error(ValueError("No value present"))
+
+    return lifted
 
 
 async def collect_results(
     results: Sequence[Awaitable[Result[A, Exception]]],
 ) -> Result[Sequence[A], Exception]:
     """Collect multiple async Results into a single Result containing all values.
-    Short-circuits on first Error."""
+    Short-circuits on the first Error to complete, cancelling the pending awaitables."""
+    pending = tuple(results)
+    if not pending:
+        return Ok([])
+    if len(pending) == 1:
+        # A single awaitable needs no tasks or scheduling; await it in place
+        try:
+            only = await pending[0]
+        except Exception as e:
+            return Error(e)
+        return only.map(lambda value: [value])
+
+    tasks = [asyncio.ensure_future(r) for r in pending]
     try:
-        completed = await asyncio.gather(*results)
-        return sequence_results(completed)
-    except Exception as e:
-        return Error(e)
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                r = await next_done
+            except Exception as e:
+                return Error(e)
+            if r.is_error():
+                return Error(r.error)
+        return Ok([task.result().ok for task in tasks])
+    finally:
+        # Runs on every exit, including cancellation of collect_results itself;
+        # cancelling an already finished task is a no-op
+        for task in tasks:
+            task.cancel()
+
+
+def install_fast_loop() -> bool:
+    """Install uvloop's event loop policy when FCSHIP_UVLOOP=1 and uvloop is installed.
+
+    uvloop is an optional dependency; without it (or without the opt-in variable) the
+    standard asyncio loop is kept and False is returned.
+    """
+    if os.environ.get("FCSHIP_UVLOOP") != "1" or importlib.util.find_spec("uvloop") is None:
+        return False
+    # Set the policy directly; uvloop.install() is deprecated from Python 3.12 on
+    uvloop = importlib.import_module("uvloop")
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 def sequence_results(results: Sequence[Result[A, Exception]]) -> Result[Sequence[A], Exception]:
     """Convert a sequence of Results into a Result of sequence.
     Short-circuits on first Error."""
-    from functools import reduce
-
-    return reduce(
-        lambda acc, r: acc.bind(lambda xs: r.map(lambda x: xs + [x])), results, Ok([])
-    ).bind(lambda lst: Ok(lst))
+    # One pass, so one-shot iterables are read only once
+    values: list[A] = []
+    for r in results:
+        if r.is_error():
+            return Error(r.error)
+        values.append(r.ok)
+    return Ok(values)
 
 
 def tap(fn: Callable[[A], Any]) -> Callable[[A], A]:
@@ -70,12 +115,9 @@ def tap_async(fn: Callable[[A], Awaitable[Any]]) -> Callable[[A], Awaitable[A]]:
     """
 
     @functools.wraps(fn)
-    def tapped(value: A) -> Awaitable[A]:
-        async def inner() -> A:
-            await fn(value)
-            return value
-
-        return inner()
+    async def tapped(value: A) -> A:
+        await fn(value)
+        return value
 
     return tapped
 
@@ -87,7 +129,9 @@ def option_to_result(opt: Option[A], error_msg: str) -> Result[A, Exception]:
     Se o Option não contiver valor (ou seja, for None), retorna um Error com a mensagem
     de erro fornecida. Caso contenha valor, retorna um Ok contendo o valor.
     """
-    return Error(ValueError(error_msg)) if opt.is_none() else Ok(opt.value)
+    # Compare the tag directly: is_none() dispatches through a match statement, and
+    # identity with Nothing is not reliable for copied or unpickled Options
+    return Ok(opt.value) if opt.tag == "some" else Error(ValueError(error_msg))
 
 
 def catch_errors(fn: Callable[P, A]) -> Callable[P, Result[A, Exception]]:
@@ -95,7 +139,21 @@ def catch_errors(fn: Callable[P, A]) -> Callable[P, Result[A, Exception]]:
     Wraps a function to catch any exceptions and return them as Result.Error.
     If the function succeeds, returns Result.Ok with the value.
     If the function already returns a Result, it is returned unchanged.
+    Coroutine functions are detected once, at decoration time, and get an async wrapper.
     """
+    if asyncio.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def wrapped_async(*args: P.args, **kwargs: P.kwargs) -> Result[A, Exception]:
+            try:
+                result = await fn(*args, **kwargs)
+                if isinstance(result, Result):
+                    return result
+                return Ok(result)
+            except Exception as e:
+                return Error(e)
+
+        return wrapped_async  # type: ignore[return-value]
 
     @functools.wraps(fn)
     def wrapped(*args: P.args, **kwargs: P.kwargs) -> Result[A, Exception]:
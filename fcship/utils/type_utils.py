@@ -3,8 +3,7 @@
 from collections.abc import Callable
 from typing import Any, TypeVar
 
-import typer
-from expression import Error, Ok, Result
+from expression import Ok, Result
 
 T = TypeVar("T")
 
@@ -60,39 +59,9 @@ def map_type(
             value_str = x.value
         except AttributeError:
             value_str = str(x)
-        return f(value_str).map(lambda s: type_constructor(s))
+        # Result.map dispatches through a match statement; branch on the tag directly
+        result = f(value_str)
+        return Ok(type_constructor(result.ok)) if result.is_ok() else result
 
     return mapper
 
-
-def validate_operation(
-    operation: str,
-    valid_operations: list[str],
-    name: str | None = None,
-    requires_name: list[str] | None = None,
-) -> Result[str, Exception]:
-    """
-    Valida uma operação de comando e os seus argumentos, garantindo que a operação
-    esteja na lista de operações válidas e que, se necessário, o parâmetro 'name' seja fornecido.
-
-    Args:
-        operation: Operação a ser validada.
-        valid_operations: Lista das operações consideradas válidas.
-        name: Nome associado à operação (opcional).
-        requires_name: Lista de operações que exigem o parâmetro 'name'.
-
-    Returns:
-        A própria operação, se for válida.
-
-    Raises:
-        typer.BadParameter: Se a operação não for válida ou se faltar o parâmetro 'name'
-                            para operações que o requerem.
-    """
-    if operation not in valid_operations:
-        valid_ops = ", ".join(valid_operations)
-        return Error(
-            typer.BadParameter(f"Operação inválida: {operation}. Operações válidas: {valid_ops}")
-        )
-    if requires_name is not None and operation in requires_name and not name:
-        return Error(typer.BadParameter(f"A operação '{operation}' requer o parâmetro 'name'."))
-    return Ok(operation)
@@ -4,9 +4,9 @@ from collections.abc import Callable, Sequence
 from typing import TypeVar
 
 import typer
-from expression import Error, Ok, Option, Result, pipe
+from expression import Error, Ok, Option, Result
 
-from .functional import option_to_result
+from .functional import option_to_result, sequence_results
 
 T = TypeVar("T")
 E = TypeVar("E", bound=Exception)
@@ -14,36 +14,21 @@ E = TypeVar("E", bound=Exception)
 
 def validate_operation(
     operation: str,
-    valid_operations: list[str],
+    valid_operations: Sequence[str],
     name: str | None = None,
-    requires_name: list[str] | None = None,
+    requires_name: Sequence[str] | None = None,
 ) -> Result[str, Exception]:
-    """Validate command operation and arguments using Expression's Try effect."""
-    valid_ops_message = ", ".join(valid_operations)
-
-    def check_operation(op: str) -> Result[str, Exception]:
-        return (
-            Ok(op)
-            if op in valid_operations
-            else Error(
-                typer.BadParameter(
-                    f"Invalid operation: {op}. Valid operations: {valid_ops_message}"
-                )
+    """Validate command operation and arguments."""
+    if operation not in valid_operations:
+        return Error(
+            typer.BadParameter(
+                f"Invalid operation: {operation}. "
+                f"Valid operations: {', '.join(valid_operations)}"
             )
         )
-
-    def check_name_requirement(op: str) -> Result[str, Exception]:
-        return (
-            Error(typer.BadParameter(f"Operation '{op}' requires a name parameter"))
-            if requires_name and op in requires_name and not name
-            else Ok(op)
-        )
-
-    return pipe(
-        Ok(operation),
-        lambda res: res.bind(check_operation),
-        lambda res: res.bind(check_name_requirement),
-    )
+    if requires_name and operation in requires_name and not name:
+        return Error(typer.BadParameter(f"Operation '{operation}' requires a name parameter"))
+    return Ok(operation)
 
 
 def validate(validator: Callable[[T], bool], error_msg: str) -> Callable[[T], Result[T, Exception]]:
@@ -70,8 +55,4 @@ def sequence_validations(
 ) -> Result[Sequence[T], Exception]:
     """Aggregate a sequence of validation Results into a single Result containing all valid values.
     Short-circuits on the first validation error encountered."""
-    from functools import reduce
-
-    return reduce(
-        lambda acc, r: acc.bind(lambda xs: r.map(lambda x: xs + [x])), validations, Ok([])
-    ).bind(lambda lst: Ok(lst))
+    return sequence_results(validations)
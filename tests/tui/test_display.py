@@ -144,6 +144,14 @@ def test_print_styled_with_exception(display_ctx, valid_display_message):
     assert "Test error" in str(result.error.rendering[1])
 
 
+def test_print_styled_passes_style_to_console(display_ctx):
+    """Test print_styled hands the style to Rich instead of wrapping content in markup."""
+    message = DisplayMessage(content=VALID_MESSAGE, style=VALID_STYLE, indent_level=1)
+    result = print_styled(display_ctx, message)
+    assert result.is_ok()
+    display_ctx.console.print.assert_called_once_with(f"  {VALID_MESSAGE}", style=VALID_STYLE)
+
+
 def test_print_rule_with_valid_message(display_ctx):
     result = print_rule(display_ctx, VALID_MESSAGE)
     assert result.is_ok()
@@ -223,6 +231,33 @@ def test_batch_display_messages_with_invalid_batch(display_ctx):
     assert "empty" in result.ok.error.validation.lower()
 
 
+def test_batch_display_messages_prints_once(valid_batch_messages, display_ctx):
+    result = batch_display_messages(display_ctx, valid_batch_messages)
+    assert result.is_ok()
+    assert result.ok.is_ok()  # The result is Ok(Ok(None))
+    display_ctx.console.print.assert_called_once()
+    args, kwargs = display_ctx.console.print.call_args
+    assert len(args) == len(valid_batch_messages.messages)
+    assert kwargs == {"sep": "\n"}
+
+
+def test_batch_display_messages_print_error(valid_batch_messages, display_ctx):
+    display_ctx.console.print.side_effect = Exception("Test error")
+    result = batch_display_messages(display_ctx, valid_batch_messages)
+    assert result.ok.is_error()  # The result is Ok(Error(...))
+    assert "Test error" in str(result.ok.error.rendering[1])
+
+
+def test_batch_display_messages_keeps_markup_per_message():
+    """Test markup opened in one batch message does not style the next one."""
+    console = Console(record=True, force_terminal=True, width=80)
+    batch = BatchMessages(messages=[("see [bold]docs", "green"), ("plain second", "red")])
+    result = batch_display_messages(DisplayContext(console=console), batch)
+    assert result.is_ok()
+    second = console.export_text(styles=True).splitlines()[1]
+    assert second == "\x1b[31mplain second\x1b[0m"
+
+
 def test_error_message_with_details_display_error(mocker, display_ctx):
     """Test error_message when details display fails."""
     mock_display = mocker.patch(
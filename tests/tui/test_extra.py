@@ -1,12 +1,15 @@
+import pytest
 from expression import Error, Ok
 
 from fcship.tui.errors import DisplayError
 from fcship.tui.extra import (
+    RetryConfig,
     UIError,
     UIOperation,
     handle_ui_error,
     ui_context_manager,
     with_fallback,
+    with_retry,
     with_ui_context,
 )
 
@@ -146,3 +149,21 @@ def test_with_ui_context_error_handling():
     assert result.is_error()
     assert result.error.tag == "rendering"
     assert "Invalid value" in str(result.error)
+
+
+@pytest.mark.asyncio
+async def test_with_retry_stops_after_max_attempts():
+    """Test with_retry retries failures and returns the last result"""
+    calls = []
+
+    def failing():
+        calls.append(1)
+        return Error(DisplayError.Validation("boom"))
+
+    result = await with_retry(failing, RetryConfig(max_attempts=3, delay=0))
+    assert result.is_error()
+    assert len(calls) == 3
+
+    outcomes = iter([Error(DisplayError.Validation("once")), Ok("done")])
+    result = await with_retry(lambda: next(outcomes), RetryConfig(max_attempts=3, delay=0))
+    assert result == Ok("done")
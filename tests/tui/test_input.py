@@ -6,6 +6,7 @@ from fcship.tui.errors import DisplayError
 from fcship.tui.input import (
     InputContext,
     TyperInputHandler,
+    confirm_action,
     get_confirmation,
     get_user_input,
     prompt_for_input,
@@ -157,6 +158,19 @@ def test_get_confirmation_error(monkeypatch):
     run_test()
 
 
+def test_confirm_action_declined():
+    """Test that declining a confirmation cancels the action"""
+    ctx = InputContext(input_handler=MockInputHandler(responses={"confirm": False}))
+
+    @effect.result[None, DisplayError]()
+    def run_test():
+        result = yield from confirm_action("Proceed?", ctx)
+        assert result.is_error()
+        assert "cancelled" in str(result.error)
+
+    run_test()
+
+
 def test_typer_input_handler():
     """Test typer input handler"""
     result = typer_input_handler(lambda: "test")
@@ -3,6 +3,7 @@ from typing import Any
 import pytest
 
 from expression import Error, Ok, effect
+from rich.console import Group
 from rich.panel import Panel
 
 from fcship.tui.errors import DisplayError
@@ -12,7 +13,6 @@ from fcship.tui.panels import (
     _create_inner_panel,
     _create_panel_safe,
     _create_panel_unsafe,
-    _join_panels,
     create_nested_panel,
     create_panel,
     create_panel_config,
@@ -69,17 +69,14 @@ def test_panel_config_validation(title: Any, content: Any, style: Any, should_su
         assert isinstance(result.error, DisplayError)
 
 
-def test_join_panels():
-    """Test panel joining with various panel combinations"""
-    panels = [
-        Panel("Content 1", title="Title 1", border_style="red"),
-        Panel("Content 2", title="Title 2", border_style="blue"),
-    ]
-    result = _join_panels(panels)
-    assert isinstance(result, str)
-    assert result != ""
-    for panel in panels:
-        assert str(panel.renderable) in result
+def test_nested_panel_groups_inner_panels():
+    """Test nested panel content keeps the inner panels as renderables"""
+    sections = [("Title 1", "Content 1"), ("Title 2", "Content 2")]
+    panel = create_nested_panel(VALID_TITLE, sections, inner_style="red").ok.ok
+    assert isinstance(panel.renderable, Group)
+    inner = panel.renderable.renderables
+    assert [p.title for p in inner] == ["Title 1", "Title 2"]
+    assert all(p.border_style == "red" for p in inner)
 
 
 @effect.result[Panel, DisplayError]()
@@ -1,4 +1,6 @@
 
+import threading
+
 from collections.abc import Generator
 from typing import Any
 
@@ -10,6 +12,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from fcship.tui.progress import (
     ProgressConfig,
     ProgressError,
+    RefreshThrottle,
     create_context,
     create_progress,
     create_progress_config,
@@ -127,6 +130,44 @@ def test_display_progress_parallel():
     run_test()
 
 
+def test_display_progress_with_generator_items():
+    """Test display_progress processes every item of a one-shot iterable"""
+
+    @effect.result[None, ProgressError]()
+    def run_test():
+        seen = []
+
+        def process(x: int) -> Generator[Any, Any, Result[int, str]]:
+            yield from []
+            seen.append(x)
+            return Ok(x)
+
+        result = yield from display_progress((i for i in range(3)), process, "Processing items")
+        assert result.is_ok()
+        assert seen == [0, 1, 2]
+
+    run_test()
+
+
+def test_display_progress_parallel_runs_items_concurrently():
+    """Test parallel progress runs items at the same time"""
+    barrier = threading.Barrier(2, timeout=5)
+
+    @effect.result[None, ProgressError]()
+    def run_test():
+        def process(x: int) -> Generator[Any, Any, Result[int, str]]:
+            yield from []
+            barrier.wait()  # only passes when both items are in flight
+            return Ok(x)
+
+        result = yield from display_progress(
+            [1, 2], process, "Processing items", parallel=True, max_workers=2
+        )
+        assert result.is_ok()
+
+    run_test()
+
+
 def test_safe_display_with_progress(sample_config):
     """Test safe progress display with error handling"""
 
@@ -215,6 +256,14 @@ def test_display_progress_error_handling():
     run_test()
 
 
+def test_refresh_throttle_skips_redraws_within_interval():
+    """Test that only the first update inside an interval triggers a redraw"""
+    throttle = RefreshThrottle(interval=60.0)
+    assert throttle.due()
+    assert not throttle.due()
+    assert RefreshThrottle(interval=0.0).due()
+
+
 def test_progress_error_creation():
     """Test ProgressError creation methods"""
     # Test from_error
@@ -1,5 +1,7 @@
 """Tests for error handling utilities."""
 
+import importlib
+
 import pytest
 
 from typer import BadParameter, Exit
@@ -55,6 +57,25 @@ def test_handle_command_errors_sync_failure():
         failing_function()
 
 
+def test_handle_command_errors_skips_no_error_wrap():
+    """Test that functions marked with no_error_wrap are returned unwrapped."""
+
+    @error_handling.no_error_wrap
+    def result_function():
+        raise ValueError("propagated")
+
+    assert error_handling.handle_command_errors(result_function) is result_function
+    with pytest.raises(ValueError, match="propagated"):
+        result_function()
+
+
+@pytest.mark.parametrize("name", ["db", "domain", "project", "repo", "test"])
+def test_result_commands_skip_error_wrapper(name):
+    """Test that Result-returning scaffold commands opt out of the error wrapper."""
+    command = getattr(importlib.import_module(f"fcship.commands.{name}"), name)
+    assert getattr(command, "_fc_no_wrap", False)
+
+
 def test_handle_command_errors_sync_error_message(monkeypatch):
     """
     Garante que, na versão síncrona, quando ocorre um erro,
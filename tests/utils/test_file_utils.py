@@ -5,14 +5,17 @@ import sys
 import pytest
 import typer
 
+from expression import Nothing, Some
 from expression.collections import Block, Map
 
 from fcship.utils.file_utils import (
     FileError,
     FileOperation,
+    acreate_files,
     create_files,
     create_single_file,
     ensure_directory,
+    find_file_in_tracker,
     init_file_creation_tracker,
     validate_operation,
     write_file,
@@ -84,6 +87,27 @@ def test_write_file(tmp_path):
         assert isinstance(error_result.error, FileError)
 
 
+@pytest.mark.parametrize("content", ["x\ud800", 123])
+def test_write_file_unencodable_content(tmp_path, content):
+    """Test that content which cannot be encoded is reported as a FileError."""
+    result = write_file(tmp_path / "test.txt", content)
+    assert result.is_error()
+    assert isinstance(result.error, FileError)
+
+
+def test_create_files_unencodable_content(tmp_path):
+    """Test that a batch with unencodable content fails with a FileError."""
+    files = Map.of_seq([("ok.txt", "fine"), ("bad.txt", "x\ud800")])
+
+    final_result = None
+    for step in create_files(files, str(tmp_path)):
+        final_result = step
+
+    assert final_result.is_error()
+    assert isinstance(final_result.error, FileError)
+    assert "bad.txt" in final_result.error.message
+
+
 def test_create_single_file(tmp_path):
     """Test single file creation."""
     test_file = tmp_path / "test.txt"
@@ -103,6 +127,16 @@ def test_create_single_file(tmp_path):
         assert op.content == content
 
 
+def test_create_single_file_unencodable_content(tmp_path):
+    """Test that create_single_file reports unencodable content as an error."""
+    final_result = None
+    for step in create_single_file(tmp_path, ("test.txt", "x\ud800")):
+        final_result = step
+
+    assert final_result.is_error()
+    assert isinstance(final_result.error, FileError)
+
+
 def test_create_files(tmp_path):
     """Test multiple file creation."""
     # Create a simple file first
@@ -119,6 +153,58 @@ def test_create_files(tmp_path):
     assert (tmp_path / "file1.txt").read_text() == "content1"
 
 
+def test_create_files_multiple(tmp_path):
+    """Test that every file is written and tracked when creating several files."""
+    files = Map.of_seq([("file1.txt", "content1"), ("nested/file2.txt", "content2")])
+
+    final_result = None
+    for step in create_files(files, str(tmp_path)):
+        final_result = step
+
+    assert final_result.is_ok()
+    assert (tmp_path / "file1.txt").read_text() == "content1"
+    assert (tmp_path / "nested" / "file2.txt").read_text() == "content2"
+    assert len(final_result.ok.files) == 2
+
+
+def test_create_files_batch(tmp_path):
+    """Test that every file of a batch spanning several directories is written."""
+    files = Map.of_seq([(f"pkg{i % 3}/module{i}.py", f"# module {i}") for i in range(10)])
+
+    final_result = None
+    for step in create_files(files, str(tmp_path)):
+        final_result = step
+
+    assert final_result.is_ok()
+    assert len(final_result.ok.files) == 10
+    for i in range(10):
+        assert (tmp_path / f"pkg{i % 3}" / f"module{i}.py").read_text() == f"# module {i}"
+
+
+def test_create_files_more_than_a_thousand(tmp_path):
+    """Test that batches past Map.of_seq's recursion limit are tracked as a Result."""
+    files = Map.of_list([(f"pkg{i % 7}/module{i}.py", "") for i in range(1200)])
+
+    final_result = None
+    for step in create_files(files, str(tmp_path)):
+        final_result = step
+
+    assert final_result.is_ok()
+    assert len(final_result.ok.files) == 1200
+
+
+@pytest.mark.asyncio
+async def test_acreate_files(tmp_path):
+    """Test creating files from async code."""
+    files = Map.of_seq([("file1.txt", "content1"), ("nested/file2.txt", "content2")])
+
+    result = await acreate_files(files, str(tmp_path))
+
+    assert result.is_ok()
+    assert len(result.ok.files) == 2
+    assert (tmp_path / "nested" / "file2.txt").read_text() == "content2"
+
+
 def test_validate_operation():
     """Test operation validation."""
     valid_ops = Block.of("create", "update", "delete")
@@ -140,6 +226,17 @@ def test_validate_operation():
     assert "Invalid operation" in str(result.error)
 
 
+def test_validate_operation_with_frozensets():
+    """Test that frozenset operation tables validate like Blocks."""
+    valid_ops = frozenset({"create", "update"})
+    requires_name = frozenset({"update"})
+
+    assert validate_operation(valid_ops, requires_name, "create", None).is_ok()
+    assert validate_operation(valid_ops, requires_name, "update", "name").is_ok()
+    assert validate_operation(valid_ops, requires_name, "update", None).is_error()
+    assert validate_operation(valid_ops, requires_name, "delete", "name").is_error()
+
+
 def test_create_files_error_handling(tmp_path):
     """Test error handling in create_files."""
     # Skip this test since it's complex to simulate file permission errors consistently
@@ -178,15 +275,23 @@ def test_file_creation_tracker_multiple_files():
     assert final_tracker.files["/test/file3.txt"] == "Skipped"
 
 
+def test_find_file_in_tracker():
+    """Test looking up a tracked file's status by path."""
+    tracker = init_file_creation_tracker().ok.add_file("/test/file1.txt", "Pending").ok
+
+    assert find_file_in_tracker(tracker, "/test/file1.txt") == Some("Pending")
+    assert find_file_in_tracker(tracker, "/test/missing.txt") is Nothing
+
+
 @pytest.mark.parametrize(
     "operation,name,expected_ok,error_message",
     [
         ("create", None, True, None),
         ("update", "test", True, None),
         ("delete", "test", True, None),
-        ("update", None, False, "Operation 'update' requires name"),
+        ("update", None, False, "Operation 'update' requires a name parameter"),
         ("invalid", None, False, "Invalid operation: invalid"),
-        ("delete", None, False, "Operation 'delete' requires name"),
+        ("delete", None, False, "Operation 'delete' requires a name parameter"),
     ],
 )
 def test_validate_operation_with_messages(operation, name, expected_ok, error_message):
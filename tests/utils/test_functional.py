@@ -1,5 +1,12 @@
 """Test cases for functional programming utilities."""
 
+import asyncio
+import importlib.machinery
+import sys
+import types
+
+from dataclasses import dataclass
+
 import pytest
 
 from expression import Error, Nothing, Ok, Option, Result, Some
@@ -7,6 +14,7 @@ from expression import Error, Nothing, Ok, Option, Result, Some
 from fcship.utils.functional import (
     catch_errors,
     collect_results,
+    install_fast_loop,
     lift_option,
     option_to_result,
     sequence_results,
@@ -42,6 +50,27 @@ def test_catch_errors_with_exception():
     assert str(result.error) == "test error"
 
 
+@pytest.mark.asyncio
+async def test_catch_errors_with_async_function():
+    """Test catch_errors awaits coroutine functions and captures their exceptions."""
+
+    @catch_errors
+    async def async_success():
+        return "success"
+
+    @catch_errors
+    async def async_failure():
+        raise ValueError("async error")
+
+    result = await async_success()
+    assert result.is_ok()
+    assert result.ok == "success"
+
+    failure = await async_failure()
+    assert failure.is_error()
+    assert str(failure.error) == "async error"
+
+
 def test_sequence_results_with_all_success():
     """Test sequence_results with all successful results."""
     results = [Ok("1"), Ok("2"), Ok("3")]
@@ -58,6 +87,12 @@ def test_sequence_results_with_failure():
     assert isinstance(combined.error, ValueError)
 
 
+def test_sequence_results_with_generator():
+    """Test sequence_results reads a one-shot iterable only once."""
+    combined = sequence_results(Ok(i) for i in range(3))
+    assert combined == Ok([0, 1, 2])
+
+
 def test_tap_with_side_effect():
     """Test tap with side effect."""
     side_effect_value = []
@@ -108,6 +143,12 @@ def test_lift_option_with_nothing():
     assert isinstance(result.error, Exception)
 
 
+def test_lift_option_errors_are_not_shared():
+    """Test each miss gets its own exception instance."""
+    lifted = lift_option(lambda _: Nothing)
+    assert lifted(1).error is not lifted(2).error
+
+
 @pytest.mark.asyncio
 async def test_collect_results_all_success():
     """Test collect_results with all successful async results."""
@@ -138,6 +179,96 @@ async def test_collect_results_with_failure():
     assert isinstance(combined.error, ValueError)
 
 
+@pytest.mark.asyncio
+async def test_collect_results_empty_and_single():
+    """Test collect_results fast paths for zero and one awaitable."""
+
+    async def async_ok(x: int):
+        return Ok(x)
+
+    async def async_error():
+        return Error(ValueError("failure"))
+
+    assert (await collect_results([])).ok == []
+    assert (await collect_results([async_ok(1)])).ok == [1]
+    assert (await collect_results([async_error()])).is_error()
+
+
+@pytest.mark.asyncio
+async def test_collect_results_cancels_pending_on_failure():
+    """Test collect_results returns on the first failure without awaiting slower results."""
+    cancelled = []
+
+    async def async_error():
+        return Error(ValueError("failure"))
+
+    async def async_slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return Ok(1)
+
+    combined = await asyncio.wait_for(collect_results([async_slow(), async_error()]), timeout=1)
+    await asyncio.sleep(0)
+    assert combined.is_error()
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_collect_results_cancelled_cancels_children():
+    """Test cancelling collect_results also cancels the awaitables it started."""
+    cancelled = []
+
+    async def async_slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return Ok(1)
+
+    outer = asyncio.ensure_future(collect_results([async_slow(), async_slow()]))
+    await asyncio.sleep(0)
+    outer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await outer
+    await asyncio.sleep(0)
+    assert cancelled == [True, True]
+
+
+def test_install_fast_loop_requires_opt_in(monkeypatch):
+    """Test install_fast_loop leaves the default loop alone unless FCSHIP_UVLOOP=1."""
+    monkeypatch.delenv("FCSHIP_UVLOOP", raising=False)
+    assert install_fast_loop() is False
+
+
+def test_install_fast_loop_without_uvloop(monkeypatch):
+    """Test install_fast_loop keeps the default loop when uvloop is not installed."""
+    monkeypatch.setenv("FCSHIP_UVLOOP", "1")
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert install_fast_loop() is False
+
+
+def test_install_fast_loop_sets_uvloop_policy(monkeypatch):
+    """Test install_fast_loop installs uvloop's policy when opted in."""
+
+    class FakePolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.__spec__ = importlib.machinery.ModuleSpec("uvloop", None)
+    fake_uvloop.EventLoopPolicy = FakePolicy
+    monkeypatch.setenv("FCSHIP_UVLOOP", "1")
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+    try:
+        assert install_fast_loop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), FakePolicy)
+    finally:
+        asyncio.set_event_loop_policy(None)
+
+
 def test_option_to_result_with_some():
     """Test option_to_result returns Ok when Option is Some."""
     from expression import Some
@@ -154,3 +285,18 @@ def test_option_to_result_with_nothing():
     result = option_to_result(Nothing, "No value present")
     assert result.is_error()
     assert isinstance(result.error, ValueError)
+
+
+def test_lift_option_accepts_unhashable_callable():
+    """Test lift_option works with callables that cannot be hashed."""
+
+    @dataclass
+    class Lookup:
+        values: dict
+
+        def __call__(self, key: str) -> Option[int]:
+            return Some(self.values[key]) if key in self.values else Nothing
+
+    lifted = lift_option(Lookup({"a": 1}))
+    assert lifted("a") == Ok(1)
+    assert lifted("b").is_error()
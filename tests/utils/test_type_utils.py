@@ -65,3 +65,17 @@ def test_map_type_with_failure():
     assert result.is_error()
     assert isinstance(result.error, ValueError)
     assert str(result.error) == "test error"
+
+
+def test_map_type_with_unhashable_transform():
+    """Test map_type accepts transformations that cannot be hashed."""
+
+    @dataclass
+    class Suffix:
+        suffix: str
+
+        def __call__(self, s: str) -> Result[str, Exception]:
+            return Ok(s + self.suffix)
+
+    mapper = map_type(Suffix("!"), str)
+    assert mapper("test") == Ok("test!")
@@ -90,6 +90,13 @@ def test_sequence_validations():
     assert result.ok == [1, 2, 3]
 
 
+def test_sequence_validations_with_generator():
+    """Test sequencing validation results from a one-shot iterable."""
+    result = sequence_validations(Ok(i) for i in range(3))
+    assert result.is_ok()
+    assert result.ok == [0, 1, 2]
+
+
 def test_sequence_validations_with_error():
     """Test sequencing with error result."""
     error = ValueError("test error")